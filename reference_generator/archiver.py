@@ -0,0 +1,167 @@
+import io
+import json
+import os
+import tarfile
+import zipfile
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from . import documenter
+from .generator import ModuleRef
+
+MANIFEST: str = 'manifest.json'
+
+
+class _BaseWriter(ABC):
+    def __init__(self, path: str) -> None:
+        self.path: str = path # path the documents are written to
+        self.documents: list[dict[str, str | int]] = [] # manifest entry of each written document
+
+        self._names: set[str] = set() # names already written
+
+    @abstractmethod
+    def _add(self, name: str, content: bytes) -> None:
+        # stores the content of one document or the manifest under its name
+        ...
+
+    @abstractmethod
+    def _close(self) -> None:
+        # releases the output once every document and the manifest are stored
+        ...
+
+    def write(self, name: str, document: str) -> None:
+        # rejects names that would overwrite the manifest or another document
+        if name == MANIFEST:
+            raise ValueError(f"'{MANIFEST}' is reserved for the manifest")
+        if name in self._names:
+            raise ValueError(f"document '{name}' has already been written")
+
+        content: bytes = document.encode()
+        self._add(name, content)
+        self._names.add(name)
+        self.documents.append({'name': name, 'size': len(content)})
+
+    def close(self, complete: bool = True) -> None:
+        # the manifest is written last and only for a complete build, so a partial build has none
+        if complete:
+            self._add(MANIFEST, json.dumps({'documents': self.documents}, indent=1).encode())
+        self._close()
+
+    def __enter__(self) -> '_BaseWriter':
+        return self
+
+    def __exit__(self, exception_type: type[BaseException] | None, *_) -> None:
+        self.close(exception_type is None)
+
+
+class DirectoryWriter(_BaseWriter):
+    def __init__(self, path: str) -> None:
+        super().__init__(path)
+
+        os.makedirs(path, exist_ok=True)
+
+    def _add(self, name: str, content: bytes) -> None:
+        # writes the document as a loose file
+        file_path: str = os.path.join(self.path, name)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, 'wb') as file:
+            file.write(content)
+
+    def _close(self) -> None:
+        pass
+
+
+class ArchiveWriter(_BaseWriter):
+    def __init__(self, path: str, archive_format: str = 'zip', compression_level: int | None = None) -> None:
+        super().__init__(path)
+
+        self.archive_format: str = archive_format # 'zip' or 'tar'
+
+        # compressed tar archives cannot be read at random, so compression is only offered for zip
+        # tar has no index and its manifest is the last member, listing a tar walks every header, so the docs server should use zip
+        self._archive: zipfile.ZipFile | tarfile.TarFile
+        match archive_format:
+            case 'zip':
+                if compression_level is None:
+                    self._archive = zipfile.ZipFile(path, 'w', zipfile.ZIP_STORED)
+                else:
+                    self._archive = zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED, compresslevel=compression_level)
+            case 'tar':
+                if compression_level is not None:
+                    raise ValueError("tar archives are written uncompressed, use 'zip' for compressed random access")
+                self._archive = tarfile.open(path, 'w:')
+            case _:
+                raise ValueError(f"unknown archive format '{archive_format}'")
+
+    def _add(self, name: str, content: bytes) -> None:
+        # streams the member straight into the archive from memory
+        if isinstance(self._archive, zipfile.ZipFile):
+            self._archive.writestr(name, content)
+        else:
+            info: tarfile.TarInfo = tarfile.TarInfo(name)
+            info.size = len(content)
+            self._archive.addfile(info, io.BytesIO(content))
+
+    def _close(self) -> None:
+        self._archive.close()
+
+
+class ArchiveReader:
+    def __init__(self, path: str) -> None:
+        self.path: str = path # path of the archive
+
+        # zip archives are indexed by their central directory, tar member headers are only read when needed
+        # the tar manifest is the last member, so the first documents() or names() call on a tar walks every header
+        self._archive: zipfile.ZipFile | tarfile.TarFile
+        self._members: dict[str, tarfile.TarInfo] = {}
+        if zipfile.is_zipfile(path):
+            self._archive = zipfile.ZipFile(path, 'r')
+        else:
+            self._archive = tarfile.open(path, 'r:')
+
+        self._documents: list[dict[str, str | int]] | None = None
+
+    def _member(self, name: str) -> tarfile.TarInfo:
+        # advances through the tar headers until the member is found, remembering every member passed
+        while name not in self._members:
+            member: tarfile.TarInfo | None = self._archive.next()
+            if member is None:
+                raise KeyError(name)
+            self._members[member.name] = member
+        return self._members[name]
+
+    def _read(self, name: str) -> bytes:
+        if isinstance(self._archive, zipfile.ZipFile):
+            return self._archive.read(name)
+
+        file: io.BufferedReader | None = self._archive.extractfile(self._member(name))
+        if file is None:
+            raise KeyError(name)
+        return file.read()
+
+    def documents(self) -> list[dict[str, str | int]]:
+        # loads the manifest on first use
+        if self._documents is None:
+            self._documents = json.loads(self._read(MANIFEST))['documents']
+        return self._documents
+
+    def names(self) -> list[str]:
+        return [str(document['name']) for document in self.documents()]
+
+    def read(self, name: str) -> str:
+        # reads a single document without extracting the rest of the archive
+        return self._read(name).decode()
+
+    def close(self) -> None:
+        self._archive.close()
+
+    def __enter__(self) -> 'ArchiveReader':
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+
+def write_modules(modules: Iterable[ModuleRef], writer: DirectoryWriter | ArchiveWriter) -> None:
+    # renders and writes each module as it is produced
+    for module in modules:
+        writer.write(f"{module.reference}.adoc", documenter.flatten(module.details()))
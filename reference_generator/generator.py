@@ -0,0 +1,122 @@
+import ast
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from . import documenter
+from .referencer import FunctionRef, ClassRef
+
+# sources at or below this size are parsed in one piece without workers
+CHUNK_SIZE: int = 1 << 20
+
+# column 0 lines that start a statement, split into decorators and definitions
+# comments and closing brackets of a multi-line decorator do not start a statement
+_STATEMENT: re.Pattern[str] = re.compile(r"^(?:(@)|(def |async def |class )|[^\s#)\]}])", re.MULTILINE)
+_DETECTED: re.Pattern[str] = re.compile(r" \(detected at line \d+\)")
+
+
+def split_source(source: str, chunk_size: int = CHUNK_SIZE) -> list[tuple[int, str]]:
+    # sources that fit in a single chunk are not scanned
+    if len(source) <= chunk_size:
+        return [(1, source)]
+
+    chunks: list[tuple[int, str]] = [] # starting line number and text of each chunk
+
+    start: int = 0 # offset of the current chunk
+    line: int = 1 # line number of the current chunk
+    decorated: bool = False # whether the previous top level statement was a decorator
+
+    # a cheap line scan, a false split inside a multi-line string is repaired when the chunks are parsed
+    for statement in _STATEMENT.finditer(source):
+        decorator, definition = statement.groups()
+        boundary: int = statement.start()
+
+        if (decorator or definition) and not decorated and boundary - start >= chunk_size:
+            text: str = source[start:boundary]
+            chunks.append((line, text))
+            line += text.count('\n')
+            start = boundary
+
+        # keeps decorators with their definition
+        decorated = decorator is not None
+
+    # appends the remaining source as the last chunk
+    chunks.append((line, source[start:]))
+
+    return chunks
+
+
+def reference_chunk(chunk: tuple[int, str], import_path: str) -> tuple[list[FunctionRef | ClassRef], list[str]]:
+    first_line, text = chunk
+    refs: list[FunctionRef | ClassRef] = []
+
+    # reports a syntax error against the original source line instead of raising
+    try:
+        module: ast.Module = ast.parse(text)
+    except SyntaxError as error:
+        # drops the chunk relative line the message may embed
+        line: int = (error.lineno or 1) + first_line - 1
+        message: str = _DETECTED.sub('', error.msg)
+        return refs, [f"{import_path}:{line}: {message}"]
+
+    for node in module.body:
+        if type(node) in (ast.FunctionDef, ast.AsyncFunctionDef) and not node.name.startswith('_'):
+            refs.append(FunctionRef(node, import_path))
+        elif type(node) == ast.ClassDef and not node.name.startswith('_'):
+            refs.append(ClassRef(node, import_path))
+
+    return refs, []
+
+
+class ModuleRef:
+    def __init__(self, source: str, import_path: str, chunk_size: int = CHUNK_SIZE, workers: int | None = None) -> None:
+        self.reference: str = import_path
+
+        self.refs: list[FunctionRef | ClassRef] = [] # references in source order
+        self.errors: list[str] = [] # syntax errors of chunks that could not be parsed
+
+        chunks: list[tuple[int, str]] = split_source(source, chunk_size)
+
+        # parses chunks in parallel workers, map keeps the results in source order
+        # a single worker parses the chunks in process, keeping the error isolation without the pool overhead
+        results: list[tuple[list[FunctionRef | ClassRef], list[str]]]
+        if len(chunks) == 1 or (workers or os.cpu_count() or 1) == 1:
+            results = [reference_chunk(chunk, import_path) for chunk in chunks]
+        else:
+            with ProcessPoolExecutor(workers) as executor:
+                results = list(executor.map(reference_chunk, chunks, repeat(import_path)))
+
+        # a false split inside a string fails on both sides, so a failed chunk is retried merged with the failed chunks after it
+        index: int = 0
+        while index < len(chunks):
+            refs, errors = results[index]
+            end: int = index + 1
+            while errors and end < len(chunks) and results[end][1]:
+                end += 1
+                merged: tuple[int, str] = (chunks[index][0], ''.join(text for _, text in chunks[index:end]))
+                merged_refs, merged_errors = reference_chunk(merged, import_path)
+                if not merged_errors:
+                    refs, errors = merged_refs, merged_errors
+
+            # reports only the failed chunk itself when no merge parses
+            if errors:
+                end = index + 1
+            self.refs += refs
+            self.errors += errors
+            index = end
+
+    def validate(self) -> list[str]:
+        problems: list[str] = [] # mismatches between the docstrings and the signatures of the module
+
+        for ref in self.refs:
+            problems += [f"{self.reference}.{ref.identifier}: {problem}" for problem in ref.validate()]
+
+        return problems
+
+    def details(self) -> documenter.document_list:
+        content: documenter.document_list = []
+
+        content.append(documenter.HeadingDoc(f"`{self.reference}`", 1))
+        for ref in self.refs: content += ref.details()
+
+        return content
@@ -0,0 +1,89 @@
+import re
+
+# patterns are anchored with fullmatch and built from negated character classes, so each line is matched in linear time
+# types may contain underscores, the greedy type only gives back the trailing '_ *' or '_ -' separator
+_HEADING: re.Pattern[str] = re.compile(r"(=+)[ \t]+([^ \t=]+)[ \t]*")
+_ITEM: re.Pattern[str] = re.compile(r"\*[ \t]+_([^*]*)_[ \t]+\*([^*]+)\*([ \t]+\(optional\))?[ \t]*-[ \t]*(.*)")
+_RETURN: re.Pattern[str] = re.compile(r"_([^-]*)_[ \t]*-[ \t]*(.*)")
+
+class Docstring:
+    def __init__(self, docstring: str) -> None:
+        self.description: str = '' # first paragraph of the docstring
+        self.explanation: str = '' # text between the description and the first section
+
+        self.parameters: list[str] = [] # documented parameter names
+        self.parameter_types: list[str] = [] # documented type corresponding to the parameter
+        self.parameter_optional: list[bool] = [] # whether the parameter is documented as optional
+        self.parameter_descriptions: list[str] = [] # description corresponding to the parameter
+
+        self.return_type: str = '' # documented return type
+        self.return_description: str = '' # description of the returned value
+
+        self.attributes: list[str] = [] # documented attribute names
+        self.attribute_types: list[str] = [] # documented type corresponding to the attribute
+        self.attribute_descriptions: list[str] = [] # description corresponding to the attribute
+
+        self._parse(docstring)
+
+    def _parse(self, docstring: str) -> None:
+        description: list[str] = [] # lines of the description paragraph
+        explanation: list[str] = [] # lines of the explanation
+        return_lines: list[str] = [] # lines of the return description
+        parameter_lines: list[list[str]] = [] # description lines of each parameter
+        attribute_lines: list[list[str]] = [] # description lines of each attribute
+        section: str = '' # name of the current section, empty before the first heading
+        descriptions: list[list[str]] | None = None # description lines of the current section for continuation lines
+
+        # walks over every line exactly once
+        for raw_line in docstring.splitlines():
+            line: str = raw_line.strip()
+
+            heading: re.Match[str] | None = _HEADING.fullmatch(line)
+            if heading:
+                section = heading.group(2).lower()
+                descriptions = None
+                continue
+
+            if not section:
+                if not line and not explanation and description:
+                    explanation.append('')
+                elif explanation:
+                    explanation.append(line)
+                elif line:
+                    description.append(line)
+                continue
+
+            if not line:
+                continue
+
+            if section in ('parameters', 'attributes'):
+                item: re.Match[str] | None = _ITEM.fullmatch(line)
+                if item:
+                    item_type, name, optional, item_description = item.groups()
+                    if section == 'parameters':
+                        self.parameters.append(name)
+                        self.parameter_types.append(item_type)
+                        self.parameter_optional.append(optional is not None)
+                        descriptions = parameter_lines
+                    else:
+                        self.attributes.append(name)
+                        self.attribute_types.append(item_type)
+                        descriptions = attribute_lines
+                    descriptions.append([item_description])
+                elif descriptions:
+                    # continuation of the previous item's description, joined once at the end
+                    descriptions[-1].append(line)
+
+            elif section == 'returns':
+                returned: re.Match[str] | None = _RETURN.fullmatch(line)
+                if returned and not return_lines:
+                    self.return_type = returned.group(1)
+                    return_lines.append(returned.group(2))
+                else:
+                    return_lines.append(line)
+
+        self.description = ' '.join(description)
+        self.explanation = '\n'.join(explanation).strip()
+        self.return_description = ' '.join(return_lines).strip()
+        self.parameter_descriptions = [' '.join(lines).strip() for lines in parameter_lines]
+        self.attribute_descriptions = [' '.join(lines).strip() for lines in attribute_lines]
@@ -1,12 +1,13 @@
 import ast
 from . import documenter
+from . import parser
 
 def get_type(expression: ast.expr) -> str:
     if isinstance(expression, ast.Name):
         return expression.id
     
     elif isinstance(expression, ast.Constant):
-        return expression.value
+        return str(expression.value)
         
     elif isinstance(expression, ast.Tuple):
         elements: list[str] = [get_type(element) for element in expression.elts]
@@ -20,7 +21,7 @@ def get_type(expression: ast.expr) -> str:
     elif isinstance(expression, ast.BinOp):
         shape: str
         match expression.op:
-            case ast.BitOr: shape = '|'
+            case ast.BitOr(): shape = '|'
             case _ : shape = ''
         left: str = get_type(expression.left)
         right: str = get_type(expression.right)
@@ -30,27 +31,58 @@ def get_type(expression: ast.expr) -> str:
         return ''
 
 
+def _union_members(type_string: str, optional: bool = False) -> set[str]:
+    # splits a type into its union members, ignoring spacing and the None of optional values
+    members: set[str] = {member.strip() for member in type_string.split('|')}
+    if optional:
+        members.discard('None')
+    return members
+
+
 class _BaseRef:
-    def __init__(self, node: ast.FunctionDef | ast.ClassDef, reference: str) -> None:
+    def __init__(self, node: ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef, reference: str) -> None:
         self.identifier: str = node.name
 
         docstring: str = ast.get_docstring(node) or ''
         self.docstring: str = docstring.strip()
         self.description: str = docstring.strip().splitlines()[0] if docstring else ''
+        self.parsed: parser.Docstring = parser.Docstring(self.docstring)
 
         self.reference: str = reference
+
+    def docstring_details(self) -> documenter.document_list:
+        # falls back to the raw docstring when it has no structured sections
+        if not (self.parsed.parameters or self.parsed.return_type or self.parsed.return_description or self.parsed.attributes):
+            return [documenter.TextDoc(self.docstring)]
+
+        content: documenter.document_list = []
+        if self.parsed.description: content.append(documenter.TextDoc(self.parsed.description))
+        if self.parsed.explanation: content.append(documenter.TextDoc(self.parsed.explanation))
+
+        return content
         
 
 class _BaseFunctionRef(_BaseRef):
-    def __init__(self, node: ast.FunctionDef, reference: str) -> None:
+    def __init__(self, node: ast.FunctionDef | ast.AsyncFunctionDef, reference: str) -> None:
         super().__init__(node, reference)
 
         arguments: ast.arguments = node.args
-        self.parameters: list[str] = [argument.arg for argument in arguments.args]
-        self.parameter_types: list[str] = [get_type(argument.annotation) if argument.annotation else '' for argument in arguments.args]
-        self.parameter_optional: list[bool] = [False] * (len(arguments.args) - len(arguments.defaults)) + [True] * len(arguments.defaults)
-
-        self.return_type: str = get_type(node.returns) if node.returns else ''
+        positional: list[ast.arg] = arguments.posonlyargs + arguments.args
+        signature: list[ast.arg] = positional + arguments.kwonlyargs
+        self.parameters: list[str] = [argument.arg for argument in signature]
+        self.parameter_types: list[str] = [get_type(argument.annotation) if argument.annotation else '' for argument in signature]
+        self.parameter_optional: list[bool] = [False] * (len(positional) - len(arguments.defaults)) + [True] * len(arguments.defaults)
+        self.parameter_optional += [default is not None for default in arguments.kw_defaults]
+
+        # a None return is treated as no return value
+        return_annotation: str = get_type(node.returns) if node.returns else ''
+        self.returns_none: bool = return_annotation == 'None'
+        self.return_type: str = '' if self.returns_none else return_annotation
+
+        # matches documented descriptions to the parameters in the signature
+        documented: dict[str, str] = dict(zip(self.parsed.parameters, self.parsed.parameter_descriptions))
+        self.parameter_descriptions: list[str] = [documented.get(parameter, '') for parameter in self.parameters]
+        self.return_description: str = self.parsed.return_description
 
         self.level: int
 
@@ -76,6 +108,50 @@ class _BaseFunctionRef(_BaseRef):
 
         return documenter.flatten(content)
 
+    def parameter_table(self) -> documenter.TableDoc:
+        parameter_table: documenter.TableDoc = documenter.TableDoc([1, 1, 5])
+        for index in range(len(self.parameters)):
+            parameter_table.add_item([
+                f"`_{self.parameter_types[index]}_`",
+                f"`*{self.parameters[index]}*`",
+                self.parameter_descriptions[index],
+            ])
+        return parameter_table
+
+    def validate(self) -> list[str]:
+        problems: list[str] = [] # mismatches between the docstring and the signature
+
+        # checks each signature parameter against its documentation
+        for index in range(len(self.parameters)):
+            parameter: str = self.parameters[index]
+            if parameter not in self.parsed.parameters:
+                problems.append(f"parameter '{parameter}' is not documented")
+                continue
+            documented_index: int = self.parsed.parameters.index(parameter)
+            documented_type: str = self.parsed.parameter_types[documented_index]
+            documented_optional: bool = self.parsed.parameter_optional[documented_index]
+            if self.parameter_types[index] and _union_members(documented_type, documented_optional) != _union_members(self.parameter_types[index], documented_optional):
+                problems.append(f"parameter '{parameter}' is documented as '{documented_type}' but annotated as '{self.parameter_types[index]}'")
+            if documented_optional != self.parameter_optional[index]:
+                problems.append(f"parameter '{parameter}' optional flag does not match the signature")
+
+        # checks for documented parameters missing from the signature
+        for parameter in self.parsed.parameters:
+            if parameter not in self.parameters:
+                problems.append(f"documented parameter '{parameter}' is not in the signature")
+
+        # checks the return documentation against the annotation
+        documented_return: str = self.parsed.return_type
+        annotated_return: str = 'None' if self.returns_none else self.return_type
+        if documented_return and annotated_return and _union_members(documented_return) != _union_members(annotated_return):
+            problems.append(f"return is documented as '{documented_return}' but annotated as '{annotated_return}'")
+        elif documented_return and not annotated_return:
+            problems.append("return is documented but not annotated")
+        elif self.return_type and not documented_return:
+            problems.append("return is not documented")
+
+        return problems
+
     def table_item(self) -> list[str]:
         content: list[str] = []
 
@@ -99,20 +175,30 @@ class _BaseFunctionRef(_BaseRef):
 
         content.append(documenter.HeadingDoc(f"`{self.identifier}`", self.level + 1))
         content.append(self.shape())
-        content.append(documenter.TextDoc(self.docstring))
+        content += self.docstring_details()
+
+        # renders the documented parameters and return value
+        if self.parameters and any(self.parameter_descriptions):
+            content.append(documenter.HeadingDoc("parameters", self.level + 2))
+            content.append(self.parameter_table())
+
+        return_type: str = self.parsed.return_type or self.return_type
+        if self.return_description:
+            content.append(documenter.HeadingDoc("returns", self.level + 2))
+            content.append(documenter.TextDoc(f"_{return_type}_ - {self.return_description}"))
 
         return content
 
 
 class FunctionRef(_BaseFunctionRef):
-    def __init__(self, node: ast.FunctionDef, import_path: str) -> None:
+    def __init__(self, node: ast.FunctionDef | ast.AsyncFunctionDef, import_path: str) -> None:
         super().__init__(node, import_path)
 
         self.level: int = 1
 
 
 class MethodRef(_BaseFunctionRef):
-    def __init__(self, node: ast.FunctionDef, class_reference: str) -> None:
+    def __init__(self, node: ast.FunctionDef | ast.AsyncFunctionDef, class_reference: str) -> None:
         super().__init__(node, class_reference)
         self.level: int = 2
         
@@ -127,10 +213,11 @@ class MethodRef(_BaseFunctionRef):
                 self.parameters.pop(index)
                 self.parameter_types.pop(index)
                 self.parameter_optional.pop(index)
+                self.parameter_descriptions.pop(index)
     
 
 class ConstructorRef(MethodRef):
-    def __init__(self, node: ast.FunctionDef, import_path: str, identifier: str) -> None:
+    def __init__(self, node: ast.FunctionDef | ast.AsyncFunctionDef, import_path: str, identifier: str) -> None:
         super().__init__(node, import_path)
 
         self.identifier = identifier
@@ -139,12 +226,16 @@ class ConstructorRef(MethodRef):
 class ClassRef(_BaseRef):
     def __init__(self, node: ast.ClassDef, import_path: str) -> None:
         super().__init__(node, import_path)
+
+        self.attributes: list[str] = self.parsed.attributes
+        self.attribute_types: list[str] = self.parsed.attribute_types
+        self.attribute_descriptions: list[str] = self.parsed.attribute_descriptions
         
-        self.constructor: ConstructorRef
+        self.constructor: ConstructorRef | None = None
 
         self.methods: list[MethodRef] = []
         for child in ast.iter_child_nodes(node):
-            if type(child) == ast.FunctionDef:
+            if type(child) in (ast.FunctionDef, ast.AsyncFunctionDef):
                 if child.name.startswith('_'):
                     if child.name == '__init__':
                         self.constructor = ConstructorRef(child, import_path, self.identifier)
@@ -167,6 +258,25 @@ class ClassRef(_BaseRef):
 
         return documenter.flatten(content)
 
+    def attribute_table(self) -> documenter.TableDoc:
+        attribute_table: documenter.TableDoc = documenter.TableDoc([1, 1, 5])
+        for index in range(len(self.attributes)):
+            attribute_table.add_item([
+                f"`_{self.attribute_types[index]}_`",
+                f"`*{self.attributes[index]}*`",
+                self.attribute_descriptions[index],
+            ])
+        return attribute_table
+
+    def validate(self) -> list[str]:
+        problems: list[str] = [] # mismatches between the docstrings and the signatures of the class
+
+        functions: list[_BaseFunctionRef] = ([self.constructor] if self.constructor else []) + self.methods
+        for function in functions:
+            problems += [f"{function.identifier}: {problem}" for problem in function.validate()]
+
+        return problems
+
     def shape(self) -> documenter.TextDoc:
         return documenter.TextDoc(f"`{self.reference}.*{self.identifier}*`")
     
@@ -196,7 +306,13 @@ class ClassRef(_BaseRef):
 
         content.append(documenter.HeadingDoc(f"`{self.identifier}`", 2))
         content.append(self.shape())
-        content.append(documenter.TextDoc(self.docstring))
+        content += self.docstring_details()
+
+        # renders the documented attributes
+        if self.attributes:
+            content.append(documenter.HeadingDoc("attributes", 3))
+            content.append(self.attribute_table())
+
         content.append(documenter.LineDoc())
         content += self.method_tables()
         content.append(documenter.LineDoc())
@@ -0,0 +1,75 @@
+import unittest
+import json
+import os
+import tempfile
+from reference_generator.archiver import DirectoryWriter, ArchiveWriter, ArchiveReader, write_modules
+from reference_generator.generator import ModuleRef
+from reference_generator.documenter import flatten
+from tests.test_referencer import open_read
+
+
+class TestArchiveWriter(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.modules: list[ModuleRef] = [
+            ModuleRef(open_read('tests/test_files/functions/full_function.py'), 'functions'),
+            ModuleRef(open_read('tests/test_files/classes/base_class.py'), 'classes'),
+        ]
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_round_trip(self) -> None:
+        for archive_format, compression_level in [('zip', None), ('zip', 9), ('tar', None)]:
+            path: str = os.path.join(self.directory.name, f"reference_{compression_level}.{archive_format}")
+            with ArchiveWriter(path, archive_format, compression_level) as writer:
+                write_modules((module for module in self.modules), writer)
+
+            with ArchiveReader(path) as reader:
+                self.assertEqual(reader.read('classes.adoc'), flatten(self.modules[1].details()))
+                self.assertEqual(reader.names(), ['functions.adoc', 'classes.adoc'])
+                self.assertEqual(reader.documents()[0]['size'], len(flatten(self.modules[0].details()).encode()))
+
+    def test_errors(self) -> None:
+        with self.assertRaises(ValueError):
+            ArchiveWriter(os.path.join(self.directory.name, 'reference.rar'), 'rar')
+        with self.assertRaises(ValueError):
+            ArchiveWriter(os.path.join(self.directory.name, 'reference.tar'), 'tar', 9)
+
+        with ArchiveWriter(os.path.join(self.directory.name, 'reference.zip')) as writer:
+            with self.assertRaises(ValueError):
+                writer.write('manifest.json', '')
+            writer.write('functions.adoc', "= functions")
+            with self.assertRaises(ValueError):
+                writer.write('functions.adoc', "= functions")
+        with ArchiveReader(os.path.join(self.directory.name, 'reference.zip')) as reader:
+            self.assertEqual(reader.names(), ['functions.adoc'])
+
+    def test_incomplete(self) -> None:
+        path: str = os.path.join(self.directory.name, 'reference.zip')
+        with self.assertRaises(RuntimeError):
+            with ArchiveWriter(path) as writer:
+                writer.write('functions.adoc', "= functions")
+                raise RuntimeError
+        with ArchiveReader(path) as reader:
+            self.assertEqual(reader.read('functions.adoc'), "= functions")
+            with self.assertRaises(KeyError):
+                reader.documents()
+
+
+class TestDirectoryWriter(unittest.TestCase):
+
+    def test_write(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            with DirectoryWriter(directory) as writer:
+                writer.write('functions.adoc', "= functions")
+                with self.assertRaises(ValueError):
+                    writer.write('manifest.json', '')
+            self.assertEqual(open_read(os.path.join(directory, 'functions.adoc')), "= functions")
+            manifest: dict = json.loads(open_read(os.path.join(directory, 'manifest.json')))
+            self.assertEqual(manifest['documents'], [{'name': 'functions.adoc', 'size': 11}])
+
+
+if __name__ == '__main__':
+    unittest.main()
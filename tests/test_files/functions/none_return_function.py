@@ -0,0 +1,14 @@
+def hello(name: str | None = None) -> None:
+    '''
+    greets the user
+
+    prints "hello" to a person
+
+    === parameters
+    * _str_ *name* (optional) - name of the person to greet
+
+    === returns
+    _None_ - nothing
+    '''
+
+    print(f"hello, {name or 'world'}")
@@ -0,0 +1,207 @@
+import unittest
+import ast
+import os
+import time
+from collections.abc import Callable
+from reference_generator.generator import split_source, ModuleRef
+from reference_generator.referencer import FunctionRef, ClassRef
+from reference_generator.documenter import flatten
+from tests.test_referencer import open_read
+
+
+def generated_source(count: int) -> str:
+    # synthetic protocol bindings, each with a multi-line string that looks like definitions
+    bindings: list[str] = []
+    for index in range(count):
+        bindings.append('\n'.join([
+            f'MESSAGE_{index} = """',
+            f"def not_code_{index}(field):",
+            f"class NotCode{index}:",
+            '"""',
+            '',
+            '',
+            "@binding",
+            f"class Message{index}:",
+            "    '''",
+            f"    message {index}",
+            '',
+            "    === attributes",
+            "    * _int_ *field* - field of the message",
+            "    '''",
+            '',
+            "    def __init__(self, field: int = 0) -> None:",
+            "        self.field: int = field",
+            '',
+            "    def encode(self, buffer: bytearray) -> int:",
+            "        '''",
+            "        encodes the message",
+            '',
+            "        ==== returns",
+            "        _int_ - bytes written",
+            "        '''",
+            "        return len(buffer)",
+            '',
+            '',
+        ]))
+    return '\n'.join(bindings)
+
+
+def elapsed(function: Callable[[], object]) -> float:
+    start: float = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+class TestSplitSource(unittest.TestCase):
+
+    def test_boundaries(self) -> None:
+        source: str = '\n'.join([
+            "import os",
+            "def one() -> None:",
+            "    pass",
+            "@decorator",
+            "@another_decorator",
+            "class Two:",
+            "    def method(self) -> None:",
+            "        pass",
+            "def three() -> None:",
+            "    pass",
+        ])
+        expected_chunks: list[tuple[int, str]] = [
+            (1, "import os\n"),
+            (2, "def one() -> None:\n    pass\n"),
+            (4, "@decorator\n@another_decorator\nclass Two:\n    def method(self) -> None:\n        pass\n"),
+            (9, "def three() -> None:\n    pass"),
+        ]
+        self.assertEqual(split_source(source, 1), expected_chunks)
+        self.assertEqual(split_source(source), [(1, source)])
+        self.assertEqual(split_source(''), [(1, '')])
+
+    def test_decorators(self) -> None:
+        source: str = '\n'.join([
+            "@decorator",
+            "# comment",
+            "def one() -> None:",
+            "    pass",
+            "@decorator(",
+            "    argument,",
+            ")",
+            "class Two:",
+            "    pass",
+        ])
+        expected_chunks: list[tuple[int, str]] = [
+            (1, "@decorator\n# comment\ndef one() -> None:\n    pass\n"),
+            (5, "@decorator(\n    argument,\n)\nclass Two:\n    pass"),
+        ]
+        self.assertEqual(split_source(source, 1), expected_chunks)
+
+
+class TestModuleRef(unittest.TestCase):
+
+    def test_refs(self) -> None:
+        function_source: str = open_read('tests/test_files/functions/full_function.py')
+        class_source: str = open_read('tests/test_files/classes/base_class.py')
+        source: str = '\n\n'.join([function_source, class_source] * 3)
+
+        whole_module: ModuleRef = ModuleRef(source, 'module')
+        chunked_module: ModuleRef = ModuleRef(source, 'module', chunk_size=1, workers=2)
+        self.assertEqual([type(ref) for ref in chunked_module.refs], [FunctionRef, ClassRef] * 3)
+        self.assertEqual([ref.identifier for ref in chunked_module.refs], [ref.identifier for ref in whole_module.refs])
+        self.assertEqual(chunked_module.errors, [])
+        self.assertEqual(chunked_module.validate(), [])
+
+    def test_validate(self) -> None:
+        source: str = '\n'.join([
+            "def hello(name: str) -> None:",
+            "    '''",
+            "    === parameters",
+            "    * _int_ *name* - name of the person to greet",
+            "    '''",
+        ])
+        module: ModuleRef = ModuleRef(source, 'module')
+        self.assertEqual(module.validate(), ["module.hello: parameter 'name' is documented as 'int' but annotated as 'str'"])
+
+    def test_definitions(self) -> None:
+        source: str = '\n'.join([
+            'X = """',
+            "def not_code",
+            "class NotCode",
+            "@not_code",
+            '"""',
+            "async def one() -> None:",
+            "    pass",
+            "class Two:",
+            "    pass",
+        ])
+        chunked_module: ModuleRef = ModuleRef(source, 'module', chunk_size=1, workers=2)
+        self.assertEqual([ref.identifier for ref in chunked_module.refs], ['one', 'Two'])
+        self.assertEqual(chunked_module.errors, [])
+
+        expected_details: str = '\n'.join([
+            "= `module`",
+            '',
+            "== `one`",
+            '',
+            "`module.*one*()`",
+            '',
+            '',
+            '',
+            "== `Two`",
+            '',
+            "`module.*Two*`",
+            '',
+            '',
+            '',
+            "'''",
+            '',
+            "'''",
+        ])
+        self.assertEqual(flatten(chunked_module.details()), expected_details)
+
+    def test_timing(self) -> None:
+        # splitting must cost a small fraction of the parse it distributes
+        source: str = generated_source(5000)
+        self.assertGreater(len(source), 2_000_000)
+        split_time: float = elapsed(lambda: split_source(source, 1 << 18))
+        parse_time: float = elapsed(lambda: ast.parse(source))
+        self.assertLess(split_time, parse_time * 0.2)
+
+    @unittest.skipIf((os.cpu_count() or 1) < 4, "parallel speedup needs several cores")
+    def test_parallel_speedup(self) -> None:
+        source: str = generated_source(5000)
+        whole_time: float = elapsed(lambda: ModuleRef(source, 'module'))
+        chunked_time: float = elapsed(lambda: ModuleRef(source, 'module', chunk_size=1 << 18))
+        self.assertLess(chunked_time, whole_time)
+
+    def test_generated_source(self) -> None:
+        source: str = generated_source(100)
+        whole_module: ModuleRef = ModuleRef(source, 'module')
+        for workers in [1, 2]:
+            chunked_module: ModuleRef = ModuleRef(source, 'module', chunk_size=1 << 10, workers=workers)
+            self.assertEqual([ref.identifier for ref in chunked_module.refs], [ref.identifier for ref in whole_module.refs])
+            self.assertEqual(chunked_module.errors, [])
+
+    def test_errors(self) -> None:
+        source: str = '\n'.join([
+            "def one() -> None:",
+            "    pass",
+            "def two(:",
+            "    pass",
+            "def three() -> None:",
+            "    pass",
+        ])
+        chunked_module: ModuleRef = ModuleRef(source, 'module', chunk_size=1, workers=2)
+        self.assertEqual([ref.identifier for ref in chunked_module.refs], ['one', 'three'])
+        self.assertEqual(len(chunked_module.errors), 1)
+        self.assertTrue(chunked_module.errors[0].startswith("module:3: "))
+
+        unterminated_module: ModuleRef = ModuleRef("def one() -> None:\n    pass\nX = '''\n", 'module', chunk_size=1)
+        self.assertEqual(unterminated_module.errors, ["module:3: unterminated triple-quoted string literal"])
+
+        whole_module: ModuleRef = ModuleRef(source, 'module')
+        self.assertEqual(whole_module.refs, [])
+        self.assertEqual(len(whole_module.errors), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import unittest
+import timeit
+from reference_generator.parser import Docstring
+
+
+class TestDocstring(unittest.TestCase):
+
+    def test_sections(self) -> None:
+        full_docstring: Docstring = Docstring('\n'.join([
+            "greets the user",
+            '',
+            "returns a greeting",
+            "to a person",
+            '',
+            "=== parameters",
+            "* _str_ *name*  - name of the person",
+            "* _bool_ *shout* (optional) - whether to",
+            "  shout the greeting",
+            '',
+            "=== returns",
+            "_str_ - a greeting",
+        ]))
+        self.assertEqual(full_docstring.description, "greets the user")
+        self.assertEqual(full_docstring.explanation, "returns a greeting\nto a person")
+        self.assertEqual(full_docstring.parameters, ['name', 'shout'])
+        self.assertEqual(full_docstring.parameter_types, ['str', 'bool'])
+        self.assertEqual(full_docstring.parameter_optional, [False, True])
+        self.assertEqual(full_docstring.parameter_descriptions, ["name of the person", "whether to shout the greeting"])
+        self.assertEqual(full_docstring.return_type, 'str')
+        self.assertEqual(full_docstring.return_description, "a greeting")
+
+    def test_attributes(self) -> None:
+        class_docstring: Docstring = Docstring('\n'.join([
+            "cat class",
+            '',
+            "=== attributes",
+            "* _str_ *name* - name of the cat",
+            "* _int_ *age* - age of the cat",
+        ]))
+        self.assertEqual(class_docstring.attributes, ['name', 'age'])
+        self.assertEqual(class_docstring.attribute_types, ['str', 'int'])
+        self.assertEqual(class_docstring.attribute_descriptions, ["name of the cat", "age of the cat"])
+        self.assertEqual(class_docstring.parameters, [])
+
+    def test_underscored_types(self) -> None:
+        underscored_docstring: Docstring = Docstring('\n'.join([
+            "=== parameters",
+            "* _my_type_ *a* - first parameter",
+            "* _dict[str, my_type]_ *b* (optional) - second parameter",
+            '',
+            "=== returns",
+            "_my_type_ - result with a-hyphen",
+        ]))
+        self.assertEqual(underscored_docstring.parameters, ['a', 'b'])
+        self.assertEqual(underscored_docstring.parameter_types, ['my_type', 'dict[str, my_type]'])
+        self.assertEqual(underscored_docstring.parameter_optional, [False, True])
+        self.assertEqual(underscored_docstring.return_type, 'my_type')
+        self.assertEqual(underscored_docstring.return_description, "result with a-hyphen")
+
+    def test_empty(self) -> None:
+        empty_docstring: Docstring = Docstring('')
+        self.assertEqual(empty_docstring.description, '')
+        self.assertEqual(empty_docstring.explanation, '')
+        self.assertEqual(empty_docstring.return_type, '')
+
+    def test_long_docstring(self) -> None:
+        # very long docstrings and unterminated markup must still parse in a single linear pass
+        count: int = 50000
+        lines: list[str] = ["long function", '', "==== parameters"]
+        lines.append("* _" + '_' * count + " *" + '*' * count)
+        lines += [f"* _int_ *parameter_{index}* - parameter number {index}" for index in range(count)]
+        lines.append("* _str_ *continued* - first line")
+        lines += ["continued line"] * count
+        long_docstring: Docstring = Docstring('\n'.join(lines))
+        self.assertEqual(len(long_docstring.parameters), count + 1)
+        self.assertEqual(long_docstring.parameters[-2], f"parameter_{count - 1}")
+        self.assertEqual(long_docstring.parameter_descriptions[-2], f"parameter number {count - 1}")
+        self.assertEqual(long_docstring.parameter_descriptions[-1], ' '.join(["first line"] + ["continued line"] * count))
+
+
+    def test_linear_time(self) -> None:
+        # doubling the docstring must roughly double the parse time, quadratic parsing would quadruple it
+        def parse_time(count: int) -> float:
+            lines: list[str] = ["==== parameters"]
+            lines += [f"* _int_ *parameter_{index}* - parameter number {index}" for index in range(count)]
+            lines.append("* _str_ *continued* - first line")
+            lines += ["continued line"] * count
+            docstring: str = '\n'.join(lines)
+            return min(timeit.repeat(lambda: Docstring(docstring), number=1, repeat=5))
+
+        self.assertLess(parse_time(40000) / parse_time(20000), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,6 +12,11 @@ def open_read_parse(file_path: str, depth: int) -> ast.stmt:
         return node
 
 
+def open_read(file_path: str) -> str:
+    with open(file_path, 'r') as file:
+        return file.read()
+
+
 class TestFunctionRef(unittest.TestCase):
 
     def test_attributes(self) -> None:
@@ -21,7 +26,8 @@ class TestFunctionRef(unittest.TestCase):
         self.assertEqual(full_function.return_type, 'str')
         self.assertEqual(full_function.description, "greets the user")
         self.assertEqual(full_function.reference, 'functions')
-
+        self.assertEqual(full_function.parameter_descriptions, ["name of the person to greet"])
+        self.assertEqual(full_function.return_description, "a greeting")
 
     def test_docstring_template(self) -> None:
         base_function: FunctionRef = FunctionRef(open_read_parse('tests/test_files/functions/base_function.py', 1), 'functions')
@@ -85,6 +91,57 @@ class TestFunctionRef(unittest.TestCase):
         ])
         self.assertEqual(full_function.docstring_template(), expected_full_function_docstring)
 
+    def test_parameter_table(self) -> None:
+        multiple_parameter_function: FunctionRef = FunctionRef(open_read_parse('tests/test_files/functions/multiple_parameter_function.py', 1), 'functions')
+        expected_multiple_parameter_function_table: list[str] = [
+            "[cols='1,1,5']",
+            "|===",
+            '',
+            "|`_str_`",
+            "|`*name*`",
+            "|name of the person to greet",
+            '',
+            "|`_bool_`",
+            "|`*shout*`",
+            "|whether or not the greeting is a shout",
+            '',
+            "|===",
+        ]
+        self.assertEqual(multiple_parameter_function.parameter_table().generate(), expected_multiple_parameter_function_table)
+
+    def test_validate(self) -> None:
+        full_function: FunctionRef = FunctionRef(open_read_parse('tests/test_files/functions/full_function.py', 1), 'functions')
+        self.assertEqual(full_function.validate(), [])
+
+        base_function: FunctionRef = FunctionRef(open_read_parse('tests/test_files/functions/base_function.py', 1), 'functions')
+        self.assertEqual(base_function.validate(), [])
+
+        return_function: FunctionRef = FunctionRef(open_read_parse('tests/test_files/functions/return_function.py', 1), 'functions')
+        self.assertEqual(return_function.validate(), [])
+
+        none_return_function: FunctionRef = FunctionRef(open_read_parse('tests/test_files/functions/none_return_function.py', 1), 'functions')
+        self.assertEqual(none_return_function.parameter_types, ['str | None'])
+        self.assertEqual(none_return_function.return_type, '')
+        self.assertEqual(none_return_function.validate(), [])
+
+        base_class: ClassRef = ClassRef(open_read_parse('tests/test_files/classes/base_class.py', 1), 'classes')
+        self.assertEqual(base_class.constructor.validate(), [])
+        self.assertEqual(base_class.validate(), [])
+
+        keyword_function: FunctionRef = FunctionRef(ast.parse('\n'.join([
+            "def hello(greeting: str, /, name: str, *, shout: bool = False, times: int) -> None:",
+            "    '''",
+            "    === parameters",
+            "    * _str_ *greeting* - greeting to use",
+            "    * _str_ *name* - name of the person to greet",
+            "    * _bool_ *shout* (optional) - whether or not the greeting is a shout",
+            "    * _int_ *times* - number of greetings",
+            "    '''",
+        ])).body[0], 'functions')
+        self.assertEqual(keyword_function.parameters, ['greeting', 'name', 'shout', 'times'])
+        self.assertEqual(keyword_function.parameter_optional, [False, False, True, False])
+        self.assertEqual(keyword_function.validate(), [])
+
     def test_table_item(self) -> None:
         base_function: FunctionRef = FunctionRef(open_read_parse('tests/test_files/functions/base_function.py', 1), 'functions')
         expected_base_function_item: list[str] = [
@@ -120,19 +177,46 @@ class TestFunctionRef(unittest.TestCase):
         self.assertEqual(flatten(base_function.details()), expected_base_function_details)
 
         return_function: FunctionRef = FunctionRef(open_read_parse('tests/test_files/functions/return_function.py', 1), 'functions')
-        expected_return_function_details: str = f"== `hello`\n\n{return_function.shape().generate()[0]}\n\n{return_function.docstring}"
+        expected_return_function_details: str = '\n'.join([
+            "== `hello`",
+            '',
+            "`functions.*hello*()`",
+            '',
+            "greets the user",
+            '',
+            "returns \"hello\"",
+            '',
+            "=== returns",
+            '',
+            "_str_ - a greeting",
+        ])
         self.assertEqual(flatten(return_function.details()), expected_return_function_details)
 
-        parameter_function: FunctionRef = FunctionRef(open_read_parse('tests/test_files/functions/parameter_function.py', 1), 'functions')
-        expected_parameter_function_details: str = f"== `hello`\n\n{parameter_function.shape().generate()[0]}\n\n{parameter_function.docstring}"
-        self.assertEqual(flatten(parameter_function.details()), expected_parameter_function_details)
-
-        multiple_parameter_function: FunctionRef = FunctionRef(open_read_parse('tests/test_files/functions/multiple_parameter_function.py', 1), 'functions')
-        expected_multiple_parameter_function_details: str = f"== `hello`\n\n{multiple_parameter_function.shape().generate()[0]}\n\n{multiple_parameter_function.docstring}"
-        self.assertEqual(flatten(multiple_parameter_function.details()), expected_multiple_parameter_function_details)
-
         full_function: FunctionRef = FunctionRef(open_read_parse('tests/test_files/functions/full_function.py', 1), 'functions')
-        expected_full_function_details: str = f"== `hello`\n\n{full_function.shape().generate()[0]}\n\n{full_function.docstring}"
+        expected_full_function_details: str = '\n'.join([
+            "== `hello`",
+            '',
+            "`functions.*hello*(_name_)`",
+            '',
+            "greets the user",
+            '',
+            "returns \"hello\"to a person",
+            '',
+            "=== parameters",
+            '',
+            "[cols='1,1,5']",
+            "|===",
+            '',
+            "|`_str_`",
+            "|`*name*`",
+            "|name of the person to greet",
+            '',
+            "|===",
+            '',
+            "=== returns",
+            '',
+            "_str_ - a greeting",
+        ])
         self.assertEqual(flatten(full_function.details()), expected_full_function_details)
 
 
@@ -143,6 +227,10 @@ class TestClassRef(unittest.TestCase):
         self.assertEqual(base_class.identifier, 'Cat')
         self.assertEqual(base_class.description, "cat class")
         self.assertEqual(base_class.reference, 'classes')
+        self.assertEqual(base_class.attributes, ['name', 'age', 'breed'])
+        self.assertEqual(base_class.attribute_types, ['str', 'int', 'str'])
+        self.assertEqual(base_class.attribute_descriptions, ["name of the cat", "age of the cat", "breed of the cat"])
+        self.assertEqual(base_class.constructor.parameter_descriptions, ["name of the cat", "age of the cat", "breed of the cat"])
     
     def test_docstring_template(self) -> None:
         base_class: ClassRef = ClassRef(open_read_parse('tests/test_files/classes/base_class.py', 1), 'classes')
@@ -194,7 +282,42 @@ class TestClassRef(unittest.TestCase):
         self.assertEqual(base_class.shape().generate()[0], expected_base_class_shape)
 
     def test_details(self) -> None:
-        pass
+        base_class: ClassRef = ClassRef(open_read_parse('tests/test_files/classes/base_class.py', 1), 'classes')
+        expected_base_class_details: str = '\n'.join([
+            "== `Cat`",
+            '',
+            "`classes.*Cat*`",
+            '',
+            "cat class",
+            '',
+            "class for a cat 'object'",
+            '',
+            "=== attributes",
+            '',
+            "[cols='1,1,5']",
+            "|===",
+            '',
+            "|`_str_`",
+            "|`*name*`",
+            "|name of the cat",
+            '',
+            "|`_int_`",
+            "|`*age*`",
+            "|age of the cat",
+            '',
+            "|`_str_`",
+            "|`*breed*`",
+            "|breed of the cat",
+            '',
+            "|===",
+            '',
+            "'''",
+        ])
+        self.assertEqual(flatten(base_class.details()[:7]), expected_base_class_details)
+
+        constructor_details: str = flatten(base_class.constructor.details())
+        self.assertIn("==== parameters", constructor_details)
+        self.assertIn("|breed of the cat", constructor_details)
 
 
 if __name__ == '__main__':